@@ -0,0 +1,6 @@
+import functools
+
+
+@functools.lru_cache(maxsize=64)
+def text_width(font, text):
+    return sum(font.CharacterWidth(ord(char)) for char in text)
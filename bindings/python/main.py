@@ -1,8 +1,6 @@
 import os
 import logging
-import time
-import threading
-import schedule
+import asyncio
 from rgbmatrix import RGBMatrix, RGBMatrixOptions
 from welcome import Welcome
 from dvd import DVD
@@ -49,17 +47,14 @@ def create_matrix():
     return RGBMatrix(options=options)
 
 
-if __name__ == "__main__":
+async def main():
     log.info("Server started.")
 
     matrix = create_matrix()
 
     loading_app = Welcome()
-    t1 = threading.Thread(
-        target=loading_app.show,
-        args=(matrix,),
-    )
-    t1.start()
+    # starts right away, so the welcome screen plays while the apps load
+    loading = asyncio.get_running_loop().run_in_executor(None, loading_app.show, matrix)
     main_app = SlackStatus(matrix.CreateFrameCanvas(), SLACK_USER_ID, SLACK_TOKEN)
     apps = list()
     apps.append(DVD(matrix.CreateFrameCanvas()))
@@ -67,23 +62,26 @@ if __name__ == "__main__":
     apps.append(Stocks(matrix.CreateFrameCanvas(), "VTI"))
     apps.append(Earth(matrix.CreateFrameCanvas()))
     apps.append(ImageViewer(matrix.CreateFrameCanvas(), path + "images/nvidia.png"))
-    t1.join()
+    await loading
 
     id = 0
     runtime = 0
     duration = 15
     while True:
-        schedule.run_pending()
         if main_app.check_status():
             main_app.show(matrix)
-            time.sleep(1 / main_app.get_framerate())
+            await asyncio.sleep(1 / main_app.get_framerate())
         else:
             framerate = apps[id].get_framerate()
             for sec in range(0, framerate):
                 apps[id].show(matrix)
-                time.sleep(1 / framerate)
+                await asyncio.sleep(1 / framerate)
 
             runtime += 1
             if runtime >= duration:
                 runtime = 0
                 id = 0 if id >= len(apps) - 1 else id + 1
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
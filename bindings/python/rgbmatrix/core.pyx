@@ -2,6 +2,7 @@
 
 from libcpp cimport bool
 from libc.stdint cimport uint8_t, uint32_t, uintptr_t
+from cython.operator cimport dereference
 import cython
 
 cdef extern from "Python.h":
@@ -86,6 +87,8 @@ cdef class FrameCanvas(Canvas):
     def SetPixel(self, int x, int y, uint8_t red, uint8_t green, uint8_t blue):
         (<cppinc.FrameCanvas*>self._getCanvas()).SetPixel(x, y, red, green, blue)
 
+    def CopyFrom(self, FrameCanvas other):
+        (<cppinc.FrameCanvas*>self._getCanvas()).CopyFrom(dereference(<cppinc.FrameCanvas*>other._getCanvas()))
 
     property width:
         def __get__(self): return (<cppinc.FrameCanvas*>self._getCanvas()).width()
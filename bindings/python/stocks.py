@@ -2,14 +2,20 @@ import os
 import logging
 import json
 import time
+import functools
+import shelve
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import zoneinfo
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import pytz
 import numpy
+from PIL import Image
 from twelvedata import TDClient, exceptions
 from apscheduler.schedulers.background import BackgroundScheduler
 from rgbmatrix import graphics
+from fonts import text_width
 from secrets import STOCKS_API_KEY, LOCAL_TZ
 
 path = os.path.dirname(__file__) + "/"
@@ -18,12 +24,92 @@ log = logging.getLogger(__name__)
 schedule = BackgroundScheduler(daemon=True)
 schedule.start()
 
+# shared so polling reuses keep-alive connections
+session = requests.Session()
+
+# fonts are immutable, every Stocks widget shares them
+font = graphics.Font()
+font.LoadFont(path + "../../fonts/5x6.bdf")
+white = graphics.Color(255, 255, 255)
+grey = graphics.Color(155, 155, 155)
+red = graphics.Color(255, 0, 0)
+green = graphics.Color(0, 255, 0)
+
+
+def nth_weekday(year, month, weekday, n):
+    # n-th given weekday of the month, counting from the end if n < 0
+    if n > 0:
+        day = date(year, month, 1)
+        day += timedelta(days=(weekday - day.weekday()) % 7 + 7 * (n - 1))
+    else:
+        day = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        day -= timedelta(days=(day.weekday() - weekday) % 7 + 7 * (-n - 1))
+    return day
+
+
+def easter(year):
+    # anonymous Gregorian algorithm
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+
+def observed(day):
+    # holidays on a Saturday are observed on Friday, on a Sunday on Monday
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@functools.lru_cache(maxsize=4)
+def nyse_holidays(year):
+    holidays = {
+        nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        easter(year) - timedelta(days=2),  # Good Friday
+        nth_weekday(year, 5, 0, -1),  # Memorial Day
+        observed(date(year, 7, 4)),  # Independence Day
+        nth_weekday(year, 9, 0, 1),  # Labor Day
+        nth_weekday(year, 11, 3, 4),  # Thanksgiving Day
+        observed(date(year, 12, 25)),  # Christmas Day
+    }
+    # no Friday closure when New Year's Day falls on a Saturday
+    if date(year, 1, 1).weekday() != 5:
+        holidays.add(observed(date(year, 1, 1)))
+    if year >= 2022:
+        holidays.add(observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+
+def is_trading_day(day):
+    return day.weekday() < 5 and day.date() not in nyse_holidays(day.year)
+
+
+def normalize(samples, close_price, height):
+    # scale to 0..height, the range always includes the closing price
+    max_val = max(float(samples.max()), close_price)
+    min_val = min(float(samples.min()), close_price)
+
+    scale = height / (max_val - min_val)
+    inflection_pt = round((close_price - min_val) * scale)
+    ys = ((samples - min_val) * scale).astype(int)
+
+    return list(enumerate(ys.tolist())), inflection_pt
+
 
 class API:
     def __init__(self):
         self.exchange = "NYSE"
         self.timezone = "America/New_York"
-        self.symbol = "NVDA"
         self.open_hour = 9
         self.open_min = 30
         self.open_time = 390  # minutes in stock day
@@ -31,70 +117,119 @@ class API:
         self.api_key = STOCKS_API_KEY
         self.td = TDClient(apikey=self.api_key)
 
-    def _try_api(self, func):
-        tries = 5
+        # seconds cached responses are reused for
+        self.intraday_ttl = 60
+        self.daily_ttl = 12 * 60 * 60
+
+        # API responses, keyed by request URL, so a restart does not re-poll
+        self.cache = None
+        self.cache_lock = Lock()
+
+    def _open_cache(self):
+        # opened on first use, another process may hold the file
+        if self.cache is None:
+            try:
+                self.cache = shelve.open(path + "market.cache")
+                for url in list(self.cache):
+                    if time.time() - self.cache[url][0] > self.daily_ttl:
+                        del self.cache[url]
+            except:
+                log.warning("API cache file unavailable, caching in memory only")
+                self.cache = shelve.Shelf(dict())
+        return self.cache
+
+    def _load(self, url, ttl):
+        with self.cache_lock:
+            cache = self._open_cache()
+            if url in cache:
+                updated, res = cache[url]
+                if time.time() - updated < ttl:
+                    log.info("API cached response for %s" % url)
+                    return res
+        return None
+
+    def _store(self, url, res):
+        with self.cache_lock:
+            cache = self._open_cache()
+            cache[url] = (time.time(), res)
+            cache.sync()
+
+    def _backoff(self, attempt):
+        # 1, 2, 4, ... seconds between attempts, capped at a minute
+        return min(60, 2**attempt)
+
+    def _complete(self, res, symbols):
+        # batch requests silently drop symbols that errored
+        return len(symbols) == 1 or all(symbol in res for symbol in symbols)
+
+    def _try_api(self, func, ttl, symbols):
+        # time series return one URL per endpoint, shelve needs a str key
+        url = ",".join(func.as_url())
+        res = self._load(url, ttl)
+        if res and self._complete(res, symbols):
+            return res
         res = None
-        while tries > 0:
+        for attempt in range(5):
             try:
                 res = func.as_json()
                 break
             except exceptions.BadRequestError:
-                log.warning("API bad request using %s" % func.as_url())
+                log.warning("API bad request using %s" % url)
                 break
             except exceptions.TwelveDataError:
+                # credits are refilled at the start of every minute
                 timeout = 61 - datetime.now().second
                 log.warning(
                     "API out of credits using %s trying again in %d seconds"
-                    % (func.as_url(), timeout)
+                    % (url, timeout)
                 )
-                tries -= 1
                 time.sleep(timeout)
             except:
-                log.warning("API exception occured")
+                timeout = self._backoff(attempt)
+                log.warning(
+                    "API exception occured trying again in %d seconds" % timeout
+                )
+                time.sleep(timeout)
         if not res:
             log.error("API errors continue after several attempts")
+        elif self._complete(res, symbols):
+            self._store(url, res)
+        else:
+            log.warning("API incomplete response using %s" % url)
         return res
 
-    def _try_request(self, url):
-        tries = 5
-        res = None
-        while tries > 0:
+    def _try_request(self, url, ttl):
+        res = self._load(url, ttl)
+        if res:
+            return res
+        for attempt in range(5):
             try:
-                json = requests.get(url).json()
+                json = session.get(url).json()
                 if isinstance(json, dict) and json["status"] == "error":
                     timeout = 61 - datetime.now().second
                     log.warning(
                         "URL bad request using %s trying again in %d seconds"
                         % (url, timeout)
                     )
-                    tries -= 1
                     time.sleep(timeout)
                     continue
                 res = json
                 break
             except:
-                log.warning("URL exception occured")
+                timeout = self._backoff(attempt)
+                log.warning(
+                    "URL exception occured trying again in %d seconds" % timeout
+                )
+                time.sleep(timeout)
         if not res:
             log.error("URL errors continue after several attempts")
-        return res
-
-    def is_trading_day(self, day):
-        ts = self.td.time_series(
-            symbol=self.symbol,
-            interval="1min",
-            outputsize=1,
-            start_date=day,
-            end_date=day + timedelta(minutes=self.open_time),
-            timezone=self.timezone,
-        )
-        res = self._try_api(ts)
-        log.info("API _is_trading_day: %s -> %s" % (ts.as_url(), res))
-
+        else:
+            self._store(url, res)
         return res
 
     def get_market_state(self):
         url = f"https://api.twelvedata.com/market_state?exchange={self.exchange}&apikey={self.api_key}"
-        res = self._try_request(url)
+        res = self._try_request(url, self.intraday_ttl)
         log.info("API _update_market_state: %s -> %s" % (url, res))
 
         return res
@@ -109,14 +244,15 @@ class API:
             end_date=day + timedelta(minutes=self.open_time),
             timezone=self.timezone,
         )
-        res = self._try_api(ts)
+        res = self._try_api(ts, self.daily_ttl, symbols)
         log.info("API get_last_close_price: %s -> %s" % (ts.as_url(), res))
 
         data = dict()
         if res:
             if len(symbols) > 1:
                 for symbol in symbols:
-                    data[symbol] = float(res[symbol][0]["close"])
+                    if res.get(symbol):
+                        data[symbol] = float(res[symbol][0]["close"])
             else:
                 data[symbols[0]] = float(res[0]["close"])
 
@@ -132,7 +268,7 @@ class API:
             end_date=day + timedelta(minutes=self.open_time),
             timezone=self.timezone,
         )
-        res = self._try_api(ts)
+        res = self._try_api(ts, self.intraday_ttl, symbols)
         log.info("API get_trading_day_data: %s -> %s" % (ts.as_url(), res))
 
         data = dict()
@@ -151,9 +287,10 @@ class Data:
         self.data_file = "data.json"
         self.data = dict()
         self.symbols = list()
+        self.lock = Lock()
 
-        self.timestamps = list(
-            numpy.rint(numpy.linspace(0, self.api.open_time - 1, 64))
+        self.timestamps = (
+            numpy.linspace(0, self.api.open_time - 1, 64).round().astype(numpy.int32)
         )
         self.graph = Graph(17, 64, self.timestamps)
 
@@ -161,20 +298,49 @@ class Data:
         self.previous_day = None
         self.next_update = None
 
+        # minutes between intraday updates, backs off while data is stale
+        self.update_interval = 3
+        self.max_update_interval = 24
+        self.current_interval = self.update_interval
+        self.latest = None
+        self.unchanged = 0
+
     def _update_data(self, previous_day, trading_day, symbols):
-        api = API()
+        api = self.api
         # prepare output stucture
         data = dict()
         for symbol in symbols:
             data[symbol] = dict()
 
+        # both requests are independent, run them side by side
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            close = pool.submit(api.get_last_close_price, previous_day, symbols)
+            trading = pool.submit(api.get_trading_day_data, trading_day, symbols)
+
         # update closing price
-        res = api.get_last_close_price(previous_day, symbols)
+        res = close.result()
+        if not res:
+            log.warning("_update_data: no closing prices, keeping cached data")
+            # still surface a failure of the intraday request
+            trading.result()
+            return
         for symbol in res:
             data[symbol]["close"] = round(res[symbol], 2)
 
         # update trading day data
-        res = api.get_trading_day_data(trading_day, symbols)
+        res = trading.result()
+        if not res:
+            log.warning("_update_data: no trading day data, keeping cached data")
+            return
+        # only symbols both requests returned data for
+        res = {
+            symbol: res[symbol]
+            for symbol in res
+            if res[symbol] and "close" in data.get(symbol, {})
+        }
+        if not res:
+            log.warning("_update_data: incomplete data, keeping cached data")
+            return
         for symbol in res:
             data[symbol]["current"] = round(float(res[symbol][0]["close"]), 2)
             data[symbol]["difference"] = round(
@@ -186,7 +352,29 @@ class Data:
             data[symbol]["graph"] = self.graph.parse(res[symbol], data[symbol]["close"])
             data[symbol]["updated"] = datetime.now().timestamp()
 
-        self._save(data)
+        self._adapt_update_interval(max(res[symbol][0]["datetime"] for symbol in res))
+        # symbols missing from either response keep their cached data
+        self._save({symbol: data[symbol] for symbol in res})
+
+    def _adapt_update_interval(self, latest):
+        if latest == self.latest:
+            self.unchanged += 1
+        else:
+            self.unchanged = 0
+        self.latest = latest
+
+        if self.unchanged >= 2:  # no new data twice in a row
+            self.unchanged = 0
+            interval = min(self.current_interval * 2, self.max_update_interval)
+        elif self.unchanged == 0:
+            interval = self.update_interval
+        else:
+            return
+
+        if interval != self.current_interval and schedule.get_job("update_data"):
+            log.info("update interval: %i minutes" % interval)
+            schedule.reschedule_job("update_data", trigger="interval", minutes=interval)
+        self.current_interval = interval
 
     def _update_market_state(self):
         # update trading day
@@ -210,20 +398,40 @@ class Data:
                 second=0,
                 microsecond=0,
             )
-        while trading_day.weekday() > 4 or not self.api.is_trading_day(trading_day):
+        while not is_trading_day(trading_day):
             trading_day -= timedelta(days=1)
         log.info("current trading day: %s" % trading_day.strftime("%Y-%m-%d"))
 
         # update previous trading day
         previous_day = trading_day - timedelta(days=1)
-        while previous_day.weekday() > 4 or not self.api.is_trading_day(previous_day):
+        while not is_trading_day(previous_day):
             previous_day -= timedelta(days=1)
         log.info("previous trading day: %s" % previous_day.strftime("%Y-%m-%d"))
 
-        self._update_data(previous_day, trading_day, self.symbols)
+        # a failed update must not stop the market state from rescheduling
+        try:
+            self._update_data(previous_day, trading_day, self.symbols)
+        except Exception:
+            log.exception("_update_data: exception occurred")
 
         # update market status
-        market_state = self.api.get_market_state()[0]
+        market_state = self.api.get_market_state()
+        if not market_state:
+            next_update = datetime.now().replace(
+                tzinfo=zoneinfo.ZoneInfo(LOCAL_TZ)
+            ) + timedelta(minutes=5)
+            log.warning(
+                "market state unavailable, trying again at %s"
+                % next_update.strftime("%Y-%m-%d %H:%M")
+            )
+            schedule.add_job(
+                self._update_market_state,
+                "date",
+                run_date=next_update,
+                id="_update_market_state",
+            )
+            return
+        market_state = market_state[0]
         if market_state["is_market_open"]:
             time_to_close = market_state["time_to_close"].split(":")
             next_update = datetime.now().replace(
@@ -237,11 +445,12 @@ class Data:
                 if job.id == "update_data":
                     exists = True
             if not exists:
+                self.current_interval = self.update_interval
                 schedule.add_job(
                     self._update_data,
                     "interval",
                     args=[previous_day, trading_day, self.symbols],
-                    minutes=3,
+                    minutes=self.current_interval,
                     id="update_data",
                 )
         else:
@@ -277,16 +486,21 @@ class Data:
         # add timestamp to data
         data["updated"] = datetime.now().timestamp()
 
-        with open("stocks.json", "r") as file:
-            load_data = json.load(file)
-        load_data.update(data)
-        with open("stocks.json", "w") as file:
-            file.write(json.dumps(load_data))
-
-        # read in only necessary symbols
-        for symbol in self.symbols:
-            if symbol in load_data:
-                self.data[symbol] = load_data[symbol]
+        # scheduler jobs run on a thread pool and may save at the same time
+        with self.lock:
+            with open("stocks.json", "r") as file:
+                load_data = json.load(file)
+            load_data.update(data)
+            with open("stocks.json", "w") as file:
+                file.write(json.dumps(load_data))
+
+            # read in only necessary symbols, swapped in as a whole so
+            # draw() never sees a half updated store
+            self.data = {
+                symbol: load_data[symbol]
+                for symbol in self.symbols
+                if symbol in load_data
+            }
 
     def add_symbol(self, symbol):
         self.symbols.append(symbol)
@@ -316,166 +530,103 @@ class Data:
 
 
 class Graph:
+    # [red, green] x [area, line]
+    colors = numpy.array(
+        [[(25, 0, 0), (255, 0, 0)], [(0, 25, 0), (0, 255, 0)]], dtype=numpy.uint8
+    )
+
     def __init__(self, height, width, timestamps):
         self.height = height
         self.width = width
         self.timestamps = timestamps
+        self.image = numpy.zeros((height + 1, width, 3), dtype=numpy.uint8)
 
     def parse(self, raw, close_price):
         data = dict()
         samples = list()
-        prev = datetime.strptime(
-            raw[-1]["datetime"], "%Y-%m-%d %H:%M:%S"
-        ) - timedelta(minutes=1)
+        by_time = {values["datetime"]: values for values in raw}
+        start = datetime.strptime(raw[-1]["datetime"], "%Y-%m-%d %H:%M:%S")
+        prev = start - timedelta(minutes=1)
         for delta in self.timestamps:
-            time = datetime.strptime(
-                raw[-1]["datetime"], "%Y-%m-%d %H:%M:%S"
-            ) + timedelta(minutes=delta)
+            time = start + timedelta(minutes=int(delta))
             sample = None
             tries = 5
             while not sample and tries > 0 and time > prev:
-                sample = list(
-                    filter(
-                        lambda values: values["datetime"]
-                        == time.strftime("%Y-%m-%d %H:%M:%S"),
-                        raw,
-                    )
-                )
+                sample = by_time.get(time.strftime("%Y-%m-%d %H:%M:%S"))
                 if not sample: time -= timedelta(minutes=1)
                 tries -= 1
             if sample:
                 prev = time
                 if delta == 0:  # first data point is at open
-                    samples.append(float(sample[0]["open"]))
+                    samples.append(float(sample["open"]))
                 else:
-                    samples.append(float(sample[0]["close"]))
+                    samples.append(float(sample["close"]))
             else:
                 break
 
-        max_val = max(samples)
-        min_val = min(samples)
+        data["values"], data["inflection_pt"] = normalize(
+            numpy.array(samples), close_price, self.height
+        )
 
-        if close_price > max_val:
-            max_val = close_price
-        elif close_price < min_val:
-            min_val = close_price
+        return data
 
-        scale = self.height / (max_val - min_val)
-        data["inflection_pt"] = round((close_price - min_val) * scale)
+    def _line(self, x0, y0, x1, y1, color):
+        # same rasterization as rgb_matrix::DrawLine(), in image coordinates
+        dx = x1 - x0
+        dy = y1 - y0
+        if abs(dx) > abs(dy):
+            if x1 < x0:
+                x0, y0, x1, y1, dx, dy = x1, y1, x0, y0, -dx, -dy
+            xs = numpy.arange(x0, x1 + 1)
+            ys = (0x8000 + (y0 << 16) + (xs - x0) * int((dy << 16) / dx)) >> 16
+        elif dy != 0:
+            if y1 < y0:
+                x0, y0, x1, y1, dx, dy = x1, y1, x0, y0, -dx, -dy
+            ys = numpy.arange(y0, y1 + 1)
+            xs = (0x8000 + (x0 << 16) + (ys - y0) * int((dx << 16) / dy)) >> 16
+        else:
+            xs = x0
+            ys = y0
+        self.image[ys, xs] = color
 
-        x = 0
-        data["values"] = list()
-        for sample in samples:
-            data["values"].append((x, int((sample - min_val) * scale)))
-            x += 1
+    def draw(self, data, canvas, x_offset, y_offset):
+        inflection_pt = data["inflection_pt"]
+        values = numpy.array(data["values"], dtype=numpy.int32).reshape(-1, 2)
+        count = len(values)
+        # graph rows are stored top down, row 0 is the graph's max value
+        xs = values[:, 0]
+        ys = self.height - values[:, 1]
+        base = self.height - inflection_pt
+
+        # index into self.colors: the area counts the close as green, the
+        # line only what is strictly above it
+        above = (values[:, 1] >= inflection_pt).astype(numpy.intp)
+        side = (values[:, 1] > inflection_pt).astype(numpy.intp)
+        crossing = numpy.where(
+            side[:-1], values[1:, 1] < inflection_pt, values[1:, 1] > inflection_pt
+        )
 
-        return data
+        self.image.fill(0)
 
-    def draw(self, data, canvas, x_offset, y_offset):
-        green = (graphics.Color(0, 25, 0), graphics.Color(0, 255, 0))
-        red = (graphics.Color(25, 0, 0), graphics.Color(255, 0, 0))
         # draw area
-        for idx in range(0, len(data["values"])):
-            x = data["values"][idx][0]
-            y = data["values"][idx][1]
-            if y >= data["inflection_pt"]:
-                graphics.DrawLine(
-                    canvas,
-                    x + x_offset,
-                    y_offset - y,
-                    x + x_offset,
-                    y_offset - data["inflection_pt"],
-                    green[0],
-                )
-            else:
-                graphics.DrawLine(
-                    canvas,
-                    x + x_offset,
-                    y_offset - y,
-                    x + x_offset,
-                    y_offset - data["inflection_pt"],
-                    red[0],
-                )
+        rows = numpy.arange(self.height + 1)[:, numpy.newaxis]
+        area = (rows >= numpy.minimum(ys, base)) & (rows <= numpy.maximum(ys, base))
+        fill = numpy.broadcast_to(self.colors[above, 0], (self.height + 1, count, 3))
+        self.image[:, :count][area] = fill[area]
+
         # draw line
-        for idx in range(0, len(data["values"])):
-            x = data["values"][idx][0]
-            y = data["values"][idx][1]
-            if y > data["inflection_pt"]:  # in the green
-                if x == len(data["values"]) - 1:  # last data point
-                    graphics.DrawLine(
-                        canvas,
-                        x + x_offset,
-                        y_offset - y,
-                        x + x_offset,
-                        y_offset - y,
-                        green[1],
-                    )
-                else:
-                    next_y = data["values"][idx + 1][1]
-                    if next_y < data["inflection_pt"]:  # transition below the line
-                        graphics.DrawLine(
-                            canvas,
-                            x + x_offset,
-                            y_offset - y,
-                            x + x_offset,
-                            y_offset - data["inflection_pt"],
-                            green[1],
-                        )
-                        graphics.DrawLine(
-                            canvas,
-                            x + x_offset,
-                            y_offset - data["inflection_pt"],
-                            x + x_offset + 1,
-                            y_offset - next_y,
-                            red[1],
-                        )
-                    else:
-                        graphics.DrawLine(
-                            canvas,
-                            x + x_offset,
-                            y_offset - y,
-                            x + x_offset + 1,
-                            y_offset - next_y,
-                            green[1],
-                        )
-            else:  # in the red
-                if x == len(data["values"]) - 1:  # last data point
-                    graphics.DrawLine(
-                        canvas,
-                        x + x_offset,
-                        y_offset - y,
-                        x + x_offset,
-                        y_offset - y,
-                        red[1],
-                    )
-                else:
-                    next_y = data["values"][idx + 1][1]
-                    if next_y > data["inflection_pt"]:  # transition above the line
-                        graphics.DrawLine(
-                            canvas,
-                            x + x_offset,
-                            y_offset - y,
-                            x + x_offset,
-                            y_offset - data["inflection_pt"],
-                            red[1],
-                        )
-                        graphics.DrawLine(
-                            canvas,
-                            x + x_offset,
-                            y_offset - data["inflection_pt"],
-                            x + x_offset + 1,
-                            y_offset - next_y,
-                            green[1],
-                        )
-                    else:
-                        graphics.DrawLine(
-                            canvas,
-                            x + x_offset,
-                            y_offset - y,
-                            x + x_offset + 1,
-                            y_offset - next_y,
-                            red[1],
-                        )
+        for idx in range(0, count - 1):
+            x = xs[idx]
+            y = ys[idx]
+            if crossing[idx]:
+                self._line(x, y, x, base, self.colors[side[idx], 1])
+                self._line(x, base, x + 1, ys[idx + 1], self.colors[1 - side[idx], 1])
+            else:
+                self._line(x, y, x + 1, ys[idx + 1], self.colors[side[idx], 1])
+        if count:  # last data point
+            self._line(xs[-1], ys[-1], xs[-1], ys[-1], self.colors[side[-1], 1])
+
+        canvas.SetImage(Image.fromarray(self.image), x_offset, y_offset - self.height)
 
 
 class Stocks:
@@ -485,6 +636,11 @@ class Stocks:
 
         self.symbol = symbol
 
+        # last rendered frame, copied to the offscreen canvas until data changes
+        self.frame = None
+        self.frame_data = None
+        self.rendered = False
+
         data_store.add_symbol(self.symbol)
 
     def __del__(self):
@@ -494,44 +650,46 @@ class Stocks:
         return self.framerate
 
     def show(self, matrix):
+        if self.frame is None:
+            self.frame = matrix.CreateFrameCanvas()
         self.offscreen_canvas = matrix.SwapOnVSync(self.draw())
 
     def draw(self):
-        self.offscreen_canvas.Clear()
-        font = graphics.Font()
-        font.LoadFont(path + "../../fonts/5x6.bdf")
-        white = graphics.Color(255, 255, 255)
-        grey = graphics.Color(155, 155, 155)
-        red = graphics.Color(255, 0, 0)
-        green = graphics.Color(0, 255, 0)
-        black = graphics.Color(0, 0, 0)
-
-        graphics.DrawText(self.offscreen_canvas, font, 1, 6, white, self.symbol)
+        # every save swaps in new entries, re-render only when that happened
+        data = data_store.data.get(self.symbol)
+        if self.frame is None:
+            return self.render(self.offscreen_canvas, data)
+
+        if not self.rendered or data is not self.frame_data:
+            self.render(self.frame, data)
+            self.frame_data = data
+            self.rendered = True
+        self.offscreen_canvas.CopyFrom(self.frame)
+
+        return self.offscreen_canvas
+
+    def render(self, canvas, data):
+        canvas.Clear()
+        graphics.DrawText(canvas, font, 1, 6, white, self.symbol)
+
+        if data is None:
+            self.draw_placeholder(canvas)
+            return canvas
+
         try:
-            self.closing_price = data_store.get_close_price(self.symbol)
-            self.curr_price = data_store.get_current_price(self.symbol)
-            self.graph_data = data_store.get_graph_data(self.symbol)
-            self.curr_diff = data_store.get_current_difference(self.symbol)
-            self.curr_percent = data_store.get_current_percent(self.symbol)
-
-            graphics.DrawText(
-                self.offscreen_canvas, font, 1, 13, grey, str("%0.2f" % self.curr_price)
-            )
-            line1_width = graphics.DrawText(
-                self.offscreen_canvas, font, 0, 0, black, str("%0.2f" % self.curr_diff)
-            )
-            line2_width = graphics.DrawText(
-                self.offscreen_canvas,
-                font,
-                0,
-                0,
-                black,
-                str("%0.2f" % self.curr_percent) + "%",
-            )
-            width = self.offscreen_canvas.width
+            self.closing_price = data["close"]
+            self.curr_price = data["current"]
+            self.graph_data = data["graph"]
+            self.curr_diff = data["difference"]
+            self.curr_percent = data["percent"]
+
+            graphics.DrawText(canvas, font, 1, 13, grey, str("%0.2f" % self.curr_price))
+            line1_width = text_width(font, str("%0.2f" % self.curr_diff))
+            line2_width = text_width(font, str("%0.2f" % self.curr_percent) + "%")
+            width = canvas.width
             if self.curr_diff >= 0:
                 graphics.DrawText(
-                    self.offscreen_canvas,
+                    canvas,
                     font,
                     width - line1_width,
                     6,
@@ -539,7 +697,7 @@ class Stocks:
                     str("%0.2f" % self.curr_diff),
                 )
                 graphics.DrawText(
-                    self.offscreen_canvas,
+                    canvas,
                     font,
                     width - line2_width,
                     13,
@@ -548,7 +706,7 @@ class Stocks:
                 )
             else:
                 graphics.DrawText(
-                    self.offscreen_canvas,
+                    canvas,
                     font,
                     width - line1_width,
                     6,
@@ -556,7 +714,7 @@ class Stocks:
                     str("%0.2f" % self.curr_diff),
                 )
                 graphics.DrawText(
-                    self.offscreen_canvas,
+                    canvas,
                     font,
                     width - line2_width,
                     13,
@@ -564,14 +722,17 @@ class Stocks:
                     str("%0.2f" % self.curr_percent) + "%",
                 )
 
-            data_store.graph.draw(self.graph_data, self.offscreen_canvas, 0, 31)
+            data_store.graph.draw(self.graph_data, canvas, 0, 31)
         except KeyError:
-            graphics.DrawText(self.offscreen_canvas, font, 1, 13, grey, "-.--")
-            graphics.DrawText(self.offscreen_canvas, font, 50, 6, grey, "-.--")
-            graphics.DrawText(self.offscreen_canvas, font, 45, 13, grey, "-.--%")
-            graphics.DrawText(self.offscreen_canvas, font, 13, 25, grey, "No data")
+            self.draw_placeholder(canvas)
 
-        return self.offscreen_canvas
+        return canvas
+
+    def draw_placeholder(self, canvas):
+        graphics.DrawText(canvas, font, 1, 13, grey, "-.--")
+        graphics.DrawText(canvas, font, 50, 6, grey, "-.--")
+        graphics.DrawText(canvas, font, 45, 13, grey, "-.--%")
+        graphics.DrawText(canvas, font, 13, 25, grey, "No data")
 
 
 data_store = Data()
@@ -5,6 +5,7 @@ from PIL import Image
 import requests
 from apscheduler.schedulers.background import BackgroundScheduler
 from rgbmatrix import graphics
+from fonts import text_width
 
 path = os.path.dirname(__file__)
 log = logging.getLogger(__name__)
@@ -12,6 +13,12 @@ log = logging.getLogger(__name__)
 schedule = BackgroundScheduler(daemon=True)
 schedule.start()
 
+session = requests.Session()
+
+font = graphics.Font()
+font.LoadFont(path + "/../../fonts/5x6.bdf")
+white = graphics.Color(255, 255, 255)
+
 
 class Weather:
     def __init__(self, offscreen_canvas, lat, lon):
@@ -24,8 +31,12 @@ class Weather:
         self.refresh = 5
 
         self.temp = "--°F"
+        self.temp_width = text_width(font, self.temp)
         self.icon_url = "https://openweathermap.org/img/wn/03n@2x.png"
-        self.icon = requests.get(self.icon_url)
+        self.icon_etag = None
+        # blank until the first scheduled refresh fetches the real icon
+        self.icon = Image.new("RGB", (18, 18))
+        self.last_modified = None
 
         schedule.add_job(self._get_weather_data)
         schedule.add_job(self._get_weather_data, "interval", minutes=self.refresh)
@@ -33,19 +44,31 @@ class Weather:
     def _get_weather_data(self):
         raw = None
         try:
-            r = requests.get(
+            headers = dict()
+            if self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+            r = session.get(
                 f"https://api.openweathermap.org/data/3.0/onecall?lat={self.lat}&lon={self.lon}&exclude=hourly,daily&units=imperial&appid={self.api_key}",
+                headers=headers,
                 timeout=7,
             )
+            if r.status_code == 304:
+                log.info("_get_weather_data: not modified")
+                return
+            self.last_modified = r.headers.get("Last-Modified")
             raw = r.json()["current"]
 
             self.temp = str(round(raw["temp"])) + "°F"
-            self.icon_url = (
+            self.temp_width = text_width(font, self.temp)
+            icon_url = (
                 "http://openweathermap.org/img/wn/"
                 + raw["weather"][0]["icon"]
                 + "@2x.png"
             )
-            self.icon = requests.get(self.icon_url, timeout=7)
+            if icon_url != self.icon_url:
+                self.icon_url = icon_url
+                self.icon_etag = None
+            self._update_icon()
 
             log.info(
                 "_get_weather_data: Temp: %s, Icon URL: %s" % (self.temp, self.icon_url)
@@ -53,6 +76,20 @@ class Weather:
         except:
             log.warning("_get_weather_data: exception occurred %s" % raw)
 
+    def _update_icon(self):
+        headers = dict()
+        if self.icon_etag:
+            headers["If-None-Match"] = self.icon_etag
+        r = session.get(self.icon_url, headers=headers, timeout=7)
+        if r.status_code == 304:
+            return
+
+        # decoded once per fetch, draw() just blits the result
+        image = Image.open(io.BytesIO(r.content))
+        image.thumbnail((18, 18))
+        self.icon = image.convert("RGB")
+        self.icon_etag = r.headers.get("ETag")
+
     def get_framerate(self):
         return self.framerate
 
@@ -61,21 +98,13 @@ class Weather:
 
     def draw(self):
         self.offscreen_canvas.Clear()
-        font = graphics.Font()
-        font.LoadFont(path + "/../../fonts/5x6.bdf")
-        white = graphics.Color(255, 255, 255)
-        black = graphics.Color(0, 0, 0)
 
-        image = Image.open(io.BytesIO(self.icon.content))
-        image.thumbnail((18, 18))
-        icon = image.convert("RGB")
-        self.offscreen_canvas.SetImage(icon, 23, 2)
+        self.offscreen_canvas.SetImage(self.icon, 23, 2)
 
-        width = graphics.DrawText(self.offscreen_canvas, font, 0, 0, black, self.temp)
         graphics.DrawText(
             self.offscreen_canvas,
             font,
-            (self.offscreen_canvas.width - width) / 2,
+            (self.offscreen_canvas.width - self.temp_width) / 2,
             24,
             white,
             self.temp,